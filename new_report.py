@@ -0,0 +1,64 @@
+"""Savings report driven by an exported disk-inventory CSV.
+
+Reads the boot/additional disk inventory produced by
+gcp_standard_disk_inventory, reshapes it into one row per disk, and
+prices an SSD-to-balanced conversion using the calculator's rate card.
+"""
+
+import sys
+
+import pandas as pd
+
+from gcp_disk_savings_calculator import calculate_savings
+
+INPUT_CSV = 'gcp_standard_disk_inventory.csv'
+OUTPUT_CSV = 'gcp_disk_conversion_savings.csv'
+
+
+def calculate_disk_conversion_savings(df):
+    """Return a savings DataFrame for every pd-ssd disk in the inventory.
+
+    The region is derived once for the whole frame with a vectorized
+    rsplit on the zone column, and the boot/additional halves of each
+    inventory row are split out with boolean masks instead of a per-row
+    loop.
+    """
+    df.columns = [col.strip() for col in df.columns]
+    df['Region'] = df['Zone'].str.rsplit('-', n=1).str[0]
+
+    boot_df = df.loc[df['Boot Disk Name'].notna(),
+                     ['Boot Disk Name', 'Boot Disk Type',
+                      'Boot Disk Size (GB)', 'VM Name', 'Zone', 'Region']]
+    boot_df = boot_df.rename(columns={'Boot Disk Name': 'Disk Name',
+                                      'Boot Disk Type': 'Disk Type',
+                                      'Boot Disk Size (GB)': 'Disk Size (GB)'})
+    boot_df['Is Boot Disk'] = 'Yes'
+
+    add_df = df.loc[df['Additional Disk Name'].notna(),
+                    ['Additional Disk Name', 'Additional Disk Type',
+                     'Additional Disk Size (GB)', 'VM Name', 'Zone', 'Region']]
+    add_df = add_df.rename(columns={'Additional Disk Name': 'Disk Name',
+                                    'Additional Disk Type': 'Disk Type',
+                                    'Additional Disk Size (GB)': 'Disk Size (GB)'})
+    add_df['Is Boot Disk'] = 'No'
+
+    disks = pd.concat([boot_df, add_df], ignore_index=True)
+    disks = disks[disks['Disk Type'] == 'pd-ssd'].reset_index(drop=True)
+    disks = disks.rename(columns={'VM Name': 'Attached To'})
+    return calculate_savings(disks)
+
+
+def main():
+    input_csv = sys.argv[1] if len(sys.argv) > 1 else INPUT_CSV
+    df = pd.read_csv(input_csv)
+
+    savings = calculate_disk_conversion_savings(df)
+    savings.to_csv(OUTPUT_CSV, index=False)
+
+    total_monthly = round(float(savings['Monthly Savings (USD)'].sum()), 2)
+    print(f'Report written to {OUTPUT_CSV}')
+    print(f'Total potential monthly savings: ${total_monthly:,.2f}')
+
+
+if __name__ == '__main__':
+    main()